@@ -3,12 +3,17 @@
 Python test using ctypes to call C ABI wrapper
 """
 import ctypes
-import time
+import mmap
+import statistics
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from bench_utils import gc_paused, sample, warmup
 
 # Build the library first if it doesn't exist
 import subprocess
-import os
 
 if not os.path.exists('./libffire.dylib'):
     subprocess.run(['make'], check=True)
@@ -26,60 +31,117 @@ lib.plugin_decode.restype = PluginHandle
 lib.plugin_encode.argtypes = [PluginHandle, ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)), ctypes.POINTER(ctypes.c_char_p)]
 lib.plugin_encode.restype = ctypes.c_size_t
 
+lib.plugin_encode_into.argtypes = [PluginHandle, ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(ctypes.c_char_p)]
+lib.plugin_encode_into.restype = ctypes.c_int
+
+lib.plugin_roundtrip.argtypes = [ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t, ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)), ctypes.POINTER(ctypes.c_char_p)]
+lib.plugin_roundtrip.restype = ctypes.c_size_t
+
 lib.plugin_free.argtypes = [PluginHandle]
 lib.plugin_free.restype = None
 
 lib.plugin_free_data.argtypes = [ctypes.POINTER(ctypes.c_uint8)]
 lib.plugin_free_data.restype = None
 
-# Read binary file
+lib.plugin_free_error.argtypes = [ctypes.c_char_p]
+lib.plugin_free_error.restype = None
+
+def as_c_buffer(data):
+    """Expose bytes/bytearray/memoryview as a c_uint8 array.
+
+    Writable buffers are wrapped in place (zero-copy); only read-only
+    buffers such as bytes are copied. The returned array holds a reference
+    to the source buffer, so it stays alive while C reads from it.
+    """
+    mv = memoryview(data).cast('B')
+    array_type = ctypes.c_uint8 * mv.nbytes
+    if mv.readonly:
+        return array_type.from_buffer_copy(mv)
+    return array_type.from_buffer(mv)
+
+# Map the fixture copy-on-write: pages come straight from the page cache and
+# the mapping is writable, so ctypes can wrap it without a copy
 with open('../common/complex.bin', 'rb') as f:
-    data = f.read()
+    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
 
-# Convert to C array
-data_array = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
+data_array = as_c_buffer(data)
 
 ITERATIONS = 100
 
-# Warmup
-for _ in range(10):
-    error = ctypes.c_char_p()
-    plugin = lib.plugin_decode(data_array, len(data), ctypes.byref(error))
-    if plugin:
-        lib.plugin_free(plugin)
+# Hoist marshalling objects and function lookups out of the timed loops
+_decode = lib.plugin_decode
+_encode_into = lib.plugin_encode_into
+_free = lib.plugin_free
+_err = ctypes.c_char_p()
+_err_ref = ctypes.byref(_err)
+_ptr = data_array
+_len = len(data)
+
+
+def take_error():
+    """Return the pending C error message and free it."""
+    msg = _err.value.decode() if _err.value else "unknown error"
+    lib.plugin_free_error(_err)
+    _err.value = None
+    return msg
+
+
+def decode_once():
+    handle = _decode(_ptr, _len, _err_ref)
+    if not handle:
+        raise RuntimeError(f"decode failed: {take_error()}")
+    _free(handle)
+
 
 # Decode benchmark
-decode_start = time.perf_counter()
-for _ in range(ITERATIONS):
-    error = ctypes.c_char_p()
-    plugin = lib.plugin_decode(data_array, len(data), ctypes.byref(error))
-    lib.plugin_free(plugin)
-decode_end = time.perf_counter()
-decode_us = int((decode_end - decode_start) * 1_000_000 / ITERATIONS)
+with gc_paused():
+    warmup(decode_once)
+    decode_us = int(statistics.median(sample(decode_once, ITERATIONS)) / 1000)
 
 # Get plugin for encoding
-error = ctypes.c_char_p()
-plugin = lib.plugin_decode(data_array, len(data), ctypes.byref(error))
+plugin = _decode(_ptr, _len, _err_ref)
+if not plugin:
+    raise RuntimeError(f"decode failed: {take_error()}")
+
+# One output buffer reused by every encode: no malloc/free per iteration
+ENCODE_CAPACITY = 64 * 1024
+out_buf = bytearray(ENCODE_CAPACITY)
+_out_ptr = as_c_buffer(out_buf)
+_written = ctypes.c_size_t()
+_written_ref = ctypes.byref(_written)
+
+
+def encode_once():
+    if _encode_into(plugin, _out_ptr, ENCODE_CAPACITY, _written_ref, _err_ref) != 0:
+        raise RuntimeError(f"encode failed: {take_error()}")
+
 
 # Encode benchmark
-encode_start = time.perf_counter()
-encoded_data = ctypes.POINTER(ctypes.c_uint8)()
-for _ in range(ITERATIONS):
-    if encoded_data:
-        lib.plugin_free_data(encoded_data)
-    encoded_size = lib.plugin_encode(plugin, ctypes.byref(encoded_data), ctypes.byref(error))
-encode_end = time.perf_counter()
-encode_us = int((encode_end - encode_start) * 1_000_000 / ITERATIONS)
+with gc_paused():
+    warmup(encode_once)
+    encode_us = int(statistics.median(sample(encode_once, ITERATIONS)) / 1000)
+
+encode_once()
+encoded_size = _written.value
+encoded = bytes(memoryview(out_buf)[:encoded_size])
+
+# Verify with a fused decode+encode: one FFI crossing, no handle
+roundtrip_data = ctypes.POINTER(ctypes.c_uint8)()
+roundtrip_size = lib.plugin_roundtrip(_ptr, _len, ctypes.byref(roundtrip_data), _err_ref)
+if not roundtrip_size:
+    raise RuntimeError(f"roundtrip failed: {take_error()}")
+roundtrip = ctypes.string_at(roundtrip_data, roundtrip_size)
+lib.plugin_free_data(roundtrip_data)
 
 # Output JSON
 result = {
     "decode_us": decode_us,
     "encode_us": encode_us,
     "size_bytes": encoded_size,
+    "roundtrip_ok": roundtrip == encoded == data[:],
     "iterations": ITERATIONS
 }
 print(json.dumps(result))
 
 # Cleanup
-lib.plugin_free_data(encoded_data)
 lib.plugin_free(plugin)
@@ -0,0 +1,136 @@
+// CPython extension exposing the C ABI wrapper without going through ctypes.
+// Buffers are taken with PyObject_GetBuffer (zero-copy) and decoded handles
+// are returned as capsules that free themselves.
+//
+// Built against the stable ABI: METH_FASTCALL joined the limited API in 3.10
+// and the buffer protocol (PyObject_GetBuffer) in 3.11.
+#define Py_LIMITED_API 0x030B0000
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include "generated_c.h"
+
+static const char* const kPluginCapsule = "ffire_ext.Plugin";
+
+static void plugin_capsule_free(PyObject* capsule) {
+    plugin_free(PyCapsule_GetPointer(capsule, kPluginCapsule));
+}
+
+// Raise ValueError from an error message returned by the C ABI
+static PyObject* raise_error(char* error_msg, const char* fallback) {
+    PyErr_SetString(PyExc_ValueError, error_msg ? error_msg : fallback);
+    if (error_msg) plugin_free_error(error_msg);
+    return nullptr;
+}
+
+static bool check_nargs(const char* name, Py_ssize_t nargs, Py_ssize_t expected) {
+    if (nargs == expected) return true;
+    PyErr_Format(PyExc_TypeError, "%s() takes exactly %zd argument(s) (%zd given)", name, expected, nargs);
+    return false;
+}
+
+// decode(data) -> capsule
+static PyObject* ffire_decode(PyObject*, PyObject* const* args, Py_ssize_t nargs) {
+    if (!check_nargs("decode", nargs, 1)) return nullptr;
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(args[0], &view, PyBUF_SIMPLE) < 0) return nullptr;
+
+    char* error_msg = nullptr;
+    PluginHandle handle = plugin_decode(static_cast<const uint8_t*>(view.buf),
+                                        static_cast<size_t>(view.len), &error_msg);
+    PyBuffer_Release(&view);
+
+    if (!handle) return raise_error(error_msg, "decode failed");
+
+    PyObject* capsule = PyCapsule_New(handle, kPluginCapsule, plugin_capsule_free);
+    if (!capsule) plugin_free(handle);
+    return capsule;
+}
+
+// encode(plugin) -> bytes
+static PyObject* ffire_encode(PyObject*, PyObject* const* args, Py_ssize_t nargs) {
+    if (!check_nargs("encode", nargs, 1)) return nullptr;
+
+    PluginHandle handle = PyCapsule_GetPointer(args[0], kPluginCapsule);
+    if (!handle) return nullptr;
+
+    uint8_t* out_data = nullptr;
+    char* error_msg = nullptr;
+    size_t size = plugin_encode(handle, &out_data, &error_msg);
+    if (!out_data) return raise_error(error_msg, "encode failed");
+
+    PyObject* result = PyBytes_FromStringAndSize(reinterpret_cast<const char*>(out_data),
+                                                 static_cast<Py_ssize_t>(size));
+    plugin_free_data(out_data);
+    return result;
+}
+
+// encode_into(plugin, out) -> int, encodes into a caller-owned writable buffer
+static PyObject* ffire_encode_into(PyObject*, PyObject* const* args, Py_ssize_t nargs) {
+    if (!check_nargs("encode_into", nargs, 2)) return nullptr;
+
+    PluginHandle handle = PyCapsule_GetPointer(args[0], kPluginCapsule);
+    if (!handle) return nullptr;
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(args[1], &view, PyBUF_WRITABLE) < 0) return nullptr;
+
+    size_t written = 0;
+    char* error_msg = nullptr;
+    int rc = plugin_encode_into(handle, static_cast<uint8_t*>(view.buf), static_cast<size_t>(view.len),
+                                &written, &error_msg);
+    PyBuffer_Release(&view);
+
+    if (rc != 0) return raise_error(error_msg, "encode failed");
+    return PyLong_FromSize_t(written);
+}
+
+// roundtrip(data) -> bytes, decode + encode in one call without a handle
+static PyObject* ffire_roundtrip(PyObject*, PyObject* const* args, Py_ssize_t nargs) {
+    if (!check_nargs("roundtrip", nargs, 1)) return nullptr;
+
+    Py_buffer view;
+    if (PyObject_GetBuffer(args[0], &view, PyBUF_SIMPLE) < 0) return nullptr;
+
+    uint8_t* out_data = nullptr;
+    char* error_msg = nullptr;
+    size_t size = plugin_roundtrip(static_cast<const uint8_t*>(view.buf),
+                                   static_cast<size_t>(view.len), &out_data, &error_msg);
+    PyBuffer_Release(&view);
+
+    if (!out_data) return raise_error(error_msg, "roundtrip failed");
+
+    PyObject* result = PyBytes_FromStringAndSize(reinterpret_cast<const char*>(out_data),
+                                                 static_cast<Py_ssize_t>(size));
+    plugin_free_data(out_data);
+    return result;
+}
+
+static PyMethodDef ffire_methods[] = {
+    {"decode", reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)(void)>(ffire_decode)), METH_FASTCALL,
+     "decode(data) -> Plugin capsule. Accepts any buffer without copying."},
+    {"encode", reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)(void)>(ffire_encode)), METH_FASTCALL,
+     "encode(plugin) -> bytes."},
+    {"encode_into", reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)(void)>(ffire_encode_into)), METH_FASTCALL,
+     "encode_into(plugin, out) -> int. Encodes into a writable buffer and returns the size written."},
+    {"roundtrip", reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)(void)>(ffire_roundtrip)), METH_FASTCALL,
+     "roundtrip(data) -> bytes. Decodes and re-encodes in a single call."},
+    {nullptr, nullptr, 0, nullptr},
+};
+
+static struct PyModuleDef ffire_module = {
+    PyModuleDef_HEAD_INIT,
+    "ffire_ext",
+    "ffire C ABI bindings as a CPython extension",
+    -1,
+    ffire_methods,
+    nullptr,
+    nullptr,
+    nullptr,
+    nullptr,
+};
+
+PyMODINIT_FUNC PyInit_ffire_ext(void) {
+    return PyModule_Create(&ffire_module);
+}
@@ -0,0 +1,16 @@
+from setuptools import setup, Extension
+
+# Build in place with: python3 setup.py build_ext --inplace
+setup(
+    name='ffire_ext',
+    ext_modules=[
+        Extension(
+            'ffire_ext',
+            sources=['ffire_ext.cpp', '../common/generated_c.cpp'],
+            include_dirs=['../common'],
+            extra_compile_args=['-std=c++17', '-O2'],
+            language='c++',
+            py_limited_api=True,
+        ),
+    ],
+)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Python test using a CPython extension to call the C ABI wrapper
+"""
+import mmap
+import statistics
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from bench_utils import gc_paused, sample, warmup
+
+# Build the extension first if it doesn't exist
+import subprocess
+
+try:
+    import ffire_ext
+except ImportError:
+    subprocess.run(['make'], check=True)
+    import ffire_ext
+
+# Map the fixture read-only; the extension takes the buffer without copying
+with open('../common/complex.bin', 'rb') as f:
+    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+ITERATIONS = 100
+
+_decode = ffire_ext.decode
+_encode_into = ffire_ext.encode_into
+
+
+def decode_once():
+    # The returned capsule frees the handle as soon as it is dropped
+    _decode(data)
+
+
+# Decode benchmark
+with gc_paused():
+    warmup(decode_once)
+    decode_us = int(statistics.median(sample(decode_once, ITERATIONS)) / 1000)
+
+# Get plugin for encoding
+plugin = _decode(data)
+
+# One output buffer reused by every encode, matching the ctypes variant
+ENCODE_CAPACITY = 64 * 1024
+out_buf = bytearray(ENCODE_CAPACITY)
+
+
+def encode_once():
+    _encode_into(plugin, out_buf)
+
+
+# Encode benchmark
+with gc_paused():
+    warmup(encode_once)
+    encode_us = int(statistics.median(sample(encode_once, ITERATIONS)) / 1000)
+encoded_size = _encode_into(plugin, out_buf)
+encoded = bytes(memoryview(out_buf)[:encoded_size])
+
+# Verify with a fused decode+encode: one call, no handle
+roundtrip = ffire_ext.roundtrip(data)
+
+# Output JSON
+result = {
+    "decode_us": decode_us,
+    "encode_us": encode_us,
+    "size_bytes": encoded_size,
+    "roundtrip_ok": roundtrip == encoded == data[:],
+    "iterations": ITERATIONS
+}
+print(json.dumps(result))
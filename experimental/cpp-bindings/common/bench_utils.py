@@ -0,0 +1,49 @@
+"""
+Timing helpers shared by the Python C ABI tests and the protobench scripts
+"""
+import contextlib
+import gc
+import statistics
+import time
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """Collect, freeze and disable the GC for the duration of a timed region."""
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+        gc.unfreeze()
+
+
+def warmup(fn, threshold=0.01, max_s=5.0, batch=32):
+    """Run fn until its per-iteration timings settle.
+
+    Stops once the median absolute deviation relative to the median stays
+    below threshold for two consecutive batches, or after max_s seconds.
+    """
+    deadline = time.perf_counter() + max_s
+    stable = 0
+    while stable < 2 and time.perf_counter() < deadline:
+        times = []
+        for _ in range(batch):
+            start = time.perf_counter_ns()
+            fn()
+            times.append(time.perf_counter_ns() - start)
+        median = statistics.median(times)
+        mad = statistics.median(abs(t - median) for t in times)
+        stable = stable + 1 if median and mad / median < threshold else 0
+
+
+def sample(fn, iterations):
+    """Time fn once per iteration and return the samples in nanoseconds."""
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        times.append(time.perf_counter_ns() - start)
+    return times
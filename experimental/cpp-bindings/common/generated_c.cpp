@@ -69,6 +69,60 @@ size_t plugin_encode(PluginHandle handle, uint8_t** out_data, char** error_msg)
     }
 }
 
+int plugin_encode_into(PluginHandle handle, uint8_t* out_data, size_t capacity, size_t* written, char** error_msg) {
+    if (!handle || !written) {
+        if (error_msg) *error_msg = make_error_msg("Invalid arguments");
+        return -1;
+    }
+    
+    try {
+        PluginHandleImpl* impl = static_cast<PluginHandleImpl*>(handle);
+        
+        // Encode into a local so the handle is left untouched
+        auto encoded = test::encode_plugin_message(impl->plugins);
+        *written = encoded.size();
+        
+        if (!out_data || *written > capacity) {
+            if (error_msg) *error_msg = make_error_msg("Output buffer too small");
+            return -1;
+        }
+        
+        // Copy into the caller's buffer; no second allocation for the result
+        std::memcpy(out_data, encoded.data(), *written);
+        return 0;
+    } catch (const std::exception& e) {
+        if (error_msg) *error_msg = make_error_msg(e.what());
+        return -1;
+    }
+}
+
+size_t plugin_roundtrip(const uint8_t* data, size_t len, uint8_t** out_data, char** error_msg) {
+    if (!data || len == 0 || !out_data) {
+        if (error_msg) *error_msg = make_error_msg("Invalid input data");
+        return 0;
+    }
+    
+    try {
+        auto plugins = test::decode_plugin_message(data, len);
+        
+        // Reject the same input plugin_decode does
+        if (plugins.empty()) {
+            if (error_msg) *error_msg = make_error_msg("No plugins in message");
+            return 0;
+        }
+        
+        auto encoded = test::encode_plugin_message(plugins);
+        
+        *out_data = new uint8_t[encoded.size()];
+        std::memcpy(*out_data, encoded.data(), encoded.size());
+        
+        return encoded.size();
+    } catch (const std::exception& e) {
+        if (error_msg) *error_msg = make_error_msg(e.what());
+        return 0;
+    }
+}
+
 void plugin_free(PluginHandle handle) {
     delete static_cast<PluginHandleImpl*>(handle);
 }
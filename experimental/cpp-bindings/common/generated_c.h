@@ -19,6 +19,15 @@ PluginHandle plugin_decode(const uint8_t* data, size_t len, char** error_msg);
 // Returns the size of the encoded data, or 0 on error
 size_t plugin_encode(PluginHandle handle, uint8_t** out_data, char** error_msg);
 
+// Encode a Plugin into a caller-owned buffer of `capacity` bytes
+// Returns 0 on success, -1 on error. *written receives the encoded size,
+// also when the buffer is too small, so the caller can retry with more room.
+int plugin_encode_into(PluginHandle handle, uint8_t* out_data, size_t capacity, size_t* written, char** error_msg);
+
+// Decode and re-encode binary data in a single call, without creating a handle
+// Returns the size of the encoded data (free with plugin_free_data), or 0 on error
+size_t plugin_roundtrip(const uint8_t* data, size_t len, uint8_t** out_data, char** error_msg);
+
 // Free a Plugin handle
 void plugin_free(PluginHandle handle);
 
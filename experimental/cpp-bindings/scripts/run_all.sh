@@ -20,6 +20,7 @@ TESTS=(
     "07-objcpp-static"
     "08-objcpp-dynamic"
     "09-python-dynamic"
+    "10-python-extension"
 )
 
 # Run each test
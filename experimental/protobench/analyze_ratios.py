@@ -6,9 +6,20 @@ This script runs protobuf benchmarks and extracts language performance ratios
 to validate ffire implementation maturity.
 """
 
+import os
 import subprocess
 import json
 import re
+from collections import defaultdict
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Google Benchmark text rows, e.g. "BM_Parse_Upb_FileDesc_mean   89830 ns   89812 ns   5"
+_BENCH_RE = re.compile(r'^(?P<name>\S.*?_mean)\s+(?P<t>\d+(?:\.\d+)?)\s+ns', re.M)
 
 def run_cpp_benchmark():
     """Run C++ protobuf benchmark and extract parse times."""
@@ -65,28 +76,19 @@ def parse_text_output(output):
     """Parse text-based benchmark output."""
     cpp_times = {}
     
-    for line in output.split('\n'):
-        if '_mean' in line and 'ns' in line:
-            # Extract benchmark name and time
-            parts = line.split()
-            if len(parts) >= 3:
-                name = parts[0]
-                time_str = parts[1]
-                
-                try:
-                    time_ns = float(time_str)
-                    
-                    if "Proto2" in name:
-                        impl = "cpp_proto2"
-                    elif "Upb" in name:
-                        impl = "cpp_upb"
-                    else:
-                        continue
-                    
-                    if impl not in cpp_times or time_ns < cpp_times[impl]:
-                        cpp_times[impl] = time_ns
-                except ValueError:
-                    continue
+    for m in _BENCH_RE.finditer(output):
+        name = m['name']
+        
+        if "Proto2" in name:
+            impl = "cpp_proto2"
+        elif "Upb" in name:
+            impl = "cpp_upb"
+        else:
+            continue
+        
+        time_ns = float(m['t'])
+        if impl not in cpp_times or time_ns < cpp_times[impl]:
+            cpp_times[impl] = time_ns
     
     return cpp_times
 
@@ -95,28 +97,23 @@ def get_ffire_ratios():
     print("\nAnalyzing ffire benchmark results...")
     
     # We'll read from our existing results
-    import os
-    import json
-    
     results_dir = "../../benchmarks/results"
     
-    languages = {}
+    languages = defaultdict(list)
     
-    for filename in os.listdir(results_dir):
-        if not filename.endswith('.json'):
-            continue
-        
-        filepath = os.path.join(results_dir, filename)
-        with open(filepath) as f:
-            data = json.load(f)
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            
+            with open(entry.path, 'rb') as f:
+                data = _loads(f.read())
             
             for result in data:
                 lang = result.get("language")
                 decode_ns = result.get("decode_ns")
                 
                 if lang and decode_ns:
-                    if lang not in languages:
-                        languages[lang] = []
                     languages[lang].append(decode_ns)
     
     # Calculate average decode times per language
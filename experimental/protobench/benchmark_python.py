@@ -5,8 +5,12 @@ This will help us compare with our ffire Python implementation.
 """
 
 import sys
-import time
 import os
+import statistics
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cpp-bindings', 'common'))
+from bench_utils import gc_paused, warmup as converge
 
 try:
     from google.protobuf import descriptor_pb2
@@ -17,29 +21,50 @@ except ImportError as e:
     print("  pip3 install protobuf --break-system-packages")
     sys.exit(1)
 
-def benchmark_parse(data, message_class, iterations=1000):
+def warmup(fn, n=200, **kwargs):
+    """Run fn n times, then until its per-iteration timings settle.
+
+    The fixed phase absorbs one-time costs such as lazy protobuf
+    initialization on the first parses; bench_utils.warmup takes it from
+    there.
+    """
+    for _ in range(n):
+        fn()
+    converge(fn, **kwargs)
+
+def measure(fn, repeat=30, sample_s=0.02):
+    """Return steady-state per-call times in ns and the calls per sample.
+    
+    timeit.autorange() calibrates how many calls fit in its 0.2 s target;
+    that count is scaled down so each of the `repeat` samples brackets
+    about sample_s of work with a single timer pair. Every sample is kept,
+    since warmup() has run before measure() starts.
+    """
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    number = max(1, round(number * sample_s / elapsed))
+    times = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return times, number
+
+def benchmark_parse(data, message_class):
     """Benchmark parsing performance."""
-    times = []
+    # A fresh message per parse: reusing one keeps growing its arena under upb
+    parse = lambda: message_class().ParseFromString(data)
+    with gc_paused():
+        warmup(parse)
+        times, number = measure(parse)
     
-    for i in range(iterations):
-        msg = message_class()
-        start = time.perf_counter_ns()
-        msg.ParseFromString(data)
-        end = time.perf_counter_ns()
-        times.append(end - start)
-    
-    # Remove outliers (first few runs may be slower due to warmup)
-    times = sorted(times)[10:-10]
-    
-    avg_time = sum(times) / len(times)
-    min_time = min(times)
-    max_time = max(times)
+    q1, median_time, q3 = statistics.quantiles(times, n=4)
     
     return {
-        'avg_ns': avg_time,
-        'min_ns': min_time,
-        'max_ns': max_time,
-        'iterations': len(times)
+        'avg_ns': statistics.mean(times),
+        'median_ns': median_time,
+        'q1_ns': q1,
+        'q3_ns': q3,
+        'min_ns': min(times),
+        'max_ns': max(times),
+        'samples': len(times),
+        'iterations': len(times) * number
     }
 
 def create_sample_file_descriptor():
@@ -102,6 +127,13 @@ def create_sample_file_descriptor():
     
     return file_desc
 
+def _build_once():
+    """Build and serialize the sample descriptor; the benchmark only needs the bytes."""
+    return create_sample_file_descriptor().SerializeToString()
+
+# Built once at import so setup cost and variance stay out of main()
+_SERIALIZED = _build_once()
+
 def main():
     print("=" * 60)
     print("Python Protobuf Parsing Benchmark")
@@ -126,9 +158,7 @@ def main():
     print(f"  - 'upb': upb binding (fast)")
     
     # Create test data
-    print("\nCreating test FileDescriptorProto...")
-    file_desc = create_sample_file_descriptor()
-    serialized = file_desc.SerializeToString()
+    serialized = _SERIALIZED
     print(f"Serialized size: {len(serialized)} bytes")
     
     target_size = 7500  # Match C++ benchmark size
@@ -142,26 +172,28 @@ def main():
         print(f"✅ Message size is comparable to C++ benchmark (~{target_size} bytes)")
     
     # Benchmark parsing
-    print(f"\nRunning benchmark with 1000 iterations...")
-    results = benchmark_parse(serialized, descriptor_pb2.FileDescriptorProto, iterations=1000)
+    print(f"\nRunning benchmark...")
+    results = benchmark_parse(serialized, descriptor_pb2.FileDescriptorProto)
     
     print("\n" + "=" * 60)
     print("RESULTS")
     print("=" * 60)
+    print(f"Median:  {results['median_ns']:.0f} ns ({results['median_ns']/1000:.2f} µs)")
     print(f"Average: {results['avg_ns']:.0f} ns ({results['avg_ns']/1000:.2f} µs)")
     print(f"Min:     {results['min_ns']:.0f} ns ({results['min_ns']/1000:.2f} µs)")
     print(f"Max:     {results['max_ns']:.0f} ns ({results['max_ns']/1000:.2f} µs)")
-    print(f"Samples: {results['iterations']}")
+    print(f"IQR:     {results['q1_ns']:.0f} - {results['q3_ns']:.0f} ns")
+    print(f"Samples: {results['samples']} x {results['iterations'] // results['samples']} iterations")
     
     # Compare with C++ baseline from our earlier measurement
     cpp_time_ns = 90000  # From protobuf C++ benchmark
-    ratio = results['avg_ns'] / cpp_time_ns
+    ratio = results['median_ns'] / cpp_time_ns
     
     print("\n" + "=" * 60)
     print("COMPARISON")
     print("=" * 60)
     print(f"C++ (upb):      {cpp_time_ns:,.0f} ns")
-    print(f"Python ({impl}): {results['avg_ns']:,.0f} ns")
+    print(f"Python ({impl}): {results['median_ns']:,.0f} ns")
     print(f"Ratio:          {ratio:.1f}x slower")
     
     # Compare with ffire
@@ -0,0 +1,50 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython decode for the TestMessage layout used in test_primitives.py:
+int32 id, uint16 name length, UTF-8 name, float64 score (little-endian).
+
+Build in place with: cythonize -i test_message.pyx
+test_primitives.py falls back to its pure Python decoder when this is not built.
+"""
+
+from struct import error as StructError
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.stdint cimport int32_t, uint16_t, uint32_t, uint64_t
+from libc.string cimport memcpy
+
+
+# Loads are assembled byte by byte, so they are little-endian on any host and
+# safe on unaligned offsets; compilers fold them into single loads on LE hosts
+cdef inline uint16_t load_u16le(const unsigned char* p) noexcept nogil:
+    return <uint16_t>p[0] | (<uint16_t>p[1] << 8)
+
+
+cdef inline uint32_t load_u32le(const unsigned char* p) noexcept nogil:
+    return (<uint32_t>p[0] | (<uint32_t>p[1] << 8) |
+            (<uint32_t>p[2] << 16) | (<uint32_t>p[3] << 24))
+
+
+cdef inline uint64_t load_u64le(const unsigned char* p) noexcept nogil:
+    return <uint64_t>load_u32le(p) | (<uint64_t>load_u32le(p + 4) << 32)
+
+
+cpdef tuple decode(const unsigned char[::1] data):
+    cdef Py_ssize_t n = data.shape[0]
+    cdef int32_t id_val
+    cdef uint16_t str_len
+    cdef uint64_t score_bits
+    cdef double score
+
+    # Raise struct.error like the pure Python decoder's unpack_from calls
+    if n < 6:
+        raise StructError("truncated TestMessage header")
+    id_val = <int32_t>load_u32le(&data[0])
+    str_len = load_u16le(&data[4])
+    if n < 6 + str_len + 8:
+        raise StructError("truncated TestMessage body")
+
+    name = PyUnicode_DecodeUTF8(<const char*>&data[6], str_len, NULL)
+    score_bits = load_u64le(&data[6 + str_len])
+    memcpy(&score, &score_bits, 8)
+    return id_val, name, score
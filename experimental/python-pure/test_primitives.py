@@ -8,6 +8,35 @@ import struct
 import time
 import sys
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# TestMessage layout: int32 id + uint16 name length, UTF-8 name, float64 score
+_HDR = struct.Struct('<iH')
+_TAIL = struct.Struct('<d')
+
+
+def _encode(id, name, score, _hdr=_HDR.pack, _tail=_TAIL.pack, _join=b''.join):
+    # Defaults bind the packers as locals (LOAD_FAST instead of global/attr lookups)
+    name_bytes = name.encode('utf-8')
+    return _join((_hdr(id, len(name_bytes)), name_bytes, _tail(score)))
+
+
+def _decode(data, _hdr_from=_HDR.unpack_from, _tail_from=_TAIL.unpack_from, _hdr_size=_HDR.size):
+    id_val, str_len = _hdr_from(data, 0)
+    pos = _hdr_size + str_len
+    return id_val, data[_hdr_size:pos].decode('utf-8'), _tail_from(data, pos)[0]
+
+
+# Prefer the compiled decoder when test_message.pyx has been built (cythonize -i)
+try:
+    from test_message import decode as _decode
+    DECODER = 'cython'
+except ImportError:
+    DECODER = 'python'
+
 def test_struct_module():
     """Test struct module for encoding/decoding primitives with endianness control"""
     print("\n=== Testing struct module ===")
@@ -92,6 +121,25 @@ def test_bytearray_performance():
     buffer = bytearray(memoryview(data).cast('B'))
     elapsed = time.perf_counter() - start
     print(f"Zero-copy array: {iterations} int32s in {elapsed*1000:.2f}ms ({elapsed/iterations*1e6:.2f}µs each)")
+    
+    # Test 4: NumPy vectorized write (little-endian int32)
+    if np is not None:
+        start = time.perf_counter()
+        buffer = np.arange(iterations, dtype='<i4').tobytes()
+        elapsed = time.perf_counter() - start
+        print(f"NumPy tobytes: {iterations} int32s in {elapsed*1000:.2f}ms ({elapsed/iterations*1e6:.2f}µs each)")
+    else:
+        print("NumPy tobytes: skipped (numpy not installed)")
+    
+    # Test 5: Precompiled Struct packing 100 values per call
+    chunk = 100
+    pack_chunk = struct.Struct(f'<{chunk}i').pack
+    start = time.perf_counter()
+    buffer = bytearray()
+    for i in range(0, iterations, chunk):
+        buffer += pack_chunk(*range(i, i + chunk))
+    elapsed = time.perf_counter() - start
+    print(f"Chunked Struct: {iterations} int32s in {elapsed*1000:.2f}ms ({elapsed/iterations*1e6:.2f}µs each)")
 
 
 def test_string_encoding():
@@ -124,33 +172,11 @@ def test_roundtrip_struct():
             self.score = score
         
         def encode(self):
-            buffer = bytearray()
-            # Write int32 id
-            buffer.extend(struct.pack('<i', self.id))
-            # Write string (uint16 length + UTF-8 bytes)
-            name_bytes = self.name.encode('utf-8')
-            buffer.extend(struct.pack('<H', len(name_bytes)))
-            buffer.extend(name_bytes)
-            # Write float64 score
-            buffer.extend(struct.pack('<d', self.score))
-            return bytes(buffer)
+            return _encode(self.id, self.name, self.score)
         
         @staticmethod
         def decode(data):
-            pos = 0
-            # Read int32 id
-            id_val = struct.unpack_from('<i', data, pos)[0]
-            pos += 4
-            # Read string
-            str_len = struct.unpack_from('<H', data, pos)[0]
-            pos += 2
-            name_val = data[pos:pos+str_len].decode('utf-8')
-            pos += str_len
-            # Read float64 score
-            score_val = struct.unpack_from('<d', data, pos)[0]
-            pos += 8
-            
-            return TestMessage(id_val, name_val, score_val)
+            return TestMessage(*_decode(data))
     
     # Test
     original = TestMessage(42, "Alice", 95.5)
@@ -164,17 +190,19 @@ def test_roundtrip_struct():
     
     # Benchmark
     iterations = 100000
+    encode = original.encode
+    decode = TestMessage.decode
     start = time.perf_counter()
     for _ in range(iterations):
-        encoded = original.encode()
+        encoded = encode()
     elapsed = time.perf_counter() - start
     print(f"\nEncode benchmark: {iterations} iterations in {elapsed*1000:.2f}ms ({elapsed/iterations*1e6:.2f}µs each)")
     
     start = time.perf_counter()
     for _ in range(iterations):
-        decoded = TestMessage.decode(encoded)
+        decoded = decode(encoded)
     elapsed = time.perf_counter() - start
-    print(f"Decode benchmark: {iterations} iterations in {elapsed*1000:.2f}ms ({elapsed/iterations*1e6:.2f}µs each)")
+    print(f"Decode benchmark ({DECODER}): {iterations} iterations in {elapsed*1000:.2f}ms ({elapsed/iterations*1e6:.2f}µs each)")
 
 
 if __name__ == "__main__":
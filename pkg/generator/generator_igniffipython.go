@@ -300,6 +300,7 @@ High-performance binary serialization using ffire format with CFFI.
 from __future__ import annotations
 from typing import Optional, List, Union, Any
 from dataclasses import dataclass
+import threading
 import numpy as np
 
 # Import the compiled CFFI extension
@@ -340,6 +341,18 @@ class Arena:
         self.dispose()
 
 
+_tls = threading.local()
+
+
+def _scratch():
+    """Return this thread's reusable (status, out_len) out-parameters."""
+    try:
+        return _tls.scratch
+    except AttributeError:
+        _tls.scratch = (ffi.new('igniffi_Status*'), ffi.new('size_t*'))
+        return _tls.scratch
+
+
 def _check_status(status) -> None:
     """Check FFI status and raise exception if failed."""
     if not status.ok:
@@ -445,13 +458,17 @@ func generatePythonMessageClass(buf *bytes.Buffer, s *schema.Schema, msg *schema
 	buf.WriteString("        Raises:\n")
 	buf.WriteString("            FFIError: If decoding fails\n")
 	buf.WriteString("        \"\"\"\n")
-	buf.WriteString("        if isinstance(data, memoryview):\n")
-	buf.WriteString("            data = bytes(data)\n")
+	buf.WriteString("        # Zero-copy view of the caller's buffer (bytes, bytearray or memoryview)\n")
+	buf.WriteString("        try:\n")
+	buf.WriteString("            buf = ffi.from_buffer('uint8_t[]', data)\n")
+	buf.WriteString("        except BufferError:\n")
+	buf.WriteString("            # Non-contiguous views (e.g. strided memoryviews) need a contiguous copy\n")
+	buf.WriteString("            buf = ffi.from_buffer('uint8_t[]', bytes(data))\n")
 	buf.WriteString("        \n")
-	buf.WriteString("        arena = Arena(len(data) * 2)\n")
-	buf.WriteString("        status = ffi.new('igniffi_Status*')\n")
+	buf.WriteString("        arena = Arena(len(buf) * 2)\n")
+	buf.WriteString("        status = _scratch()[0]\n")
 	buf.WriteString("        \n")
-	fmt.Fprintf(buf, "        handle = lib.igniffi_decode_%s(data, len(data), arena._ptr, status)\n", msgName)
+	fmt.Fprintf(buf, "        handle = lib.igniffi_decode_%s(buf, len(buf), arena._ptr, status)\n", msgName)
 	buf.WriteString("        _check_status(status[0])\n")
 	buf.WriteString("        \n")
 	buf.WriteString("        if handle == ffi.NULL:\n")
@@ -474,8 +491,7 @@ func generatePythonMessageClass(buf *bytes.Buffer, s *schema.Schema, msg *schema
 	buf.WriteString("        if self._disposed:\n")
 	buf.WriteString("            raise FFIError('Message has been disposed')\n")
 	buf.WriteString("        \n")
-	buf.WriteString("        out_len = ffi.new('size_t*')\n")
-	buf.WriteString("        status = ffi.new('igniffi_Status*')\n")
+	buf.WriteString("        status, out_len = _scratch()\n")
 	buf.WriteString("        \n")
 	fmt.Fprintf(buf, "        data_ptr = lib.igniffi_encode_%s(self._handle, out_len, self._arena._ptr, status)\n", msgName)
 	buf.WriteString("        _check_status(status[0])\n")
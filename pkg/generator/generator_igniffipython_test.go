@@ -0,0 +1,93 @@
+package generator
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/shaban/ffire/pkg/schema"
+)
+
+func TestGenerateIgniffiPythonMessageClassDecodeEncode(t *testing.T) {
+	s := &schema.Schema{
+		Package: "test",
+		Messages: []schema.MessageType{
+			{Name: "Values", TargetType: &schema.ArrayType{
+				ElementType: &schema.PrimitiveType{Name: "int32"},
+			}},
+		},
+	}
+
+	buf := &bytes.Buffer{}
+	generatePythonMessageClass(buf, s, &s.Messages[0], "test")
+	code := buf.String()
+
+	// Decode wraps the caller's buffer without copying, with a copy fallback
+	// for non-contiguous memoryviews
+	expectedDecode := []string{
+		"def decode(cls, data: Union[bytes, bytearray, memoryview]) -> 'ValuesMessage':",
+		"            buf = ffi.from_buffer('uint8_t[]', data)\n        except BufferError:\n",
+		"            buf = ffi.from_buffer('uint8_t[]', bytes(data))\n",
+		"arena = Arena(len(buf) * 2)",
+		"status = _scratch()[0]",
+		"handle = lib.igniffi_decode_values(buf, len(buf), arena._ptr, status)",
+	}
+	for _, expected := range expectedDecode {
+		if !strings.Contains(code, expected) {
+			t.Errorf("Expected decode code to contain:\n%s\n\nGot:\n%s", expected, code)
+		}
+	}
+
+	// Encode reuses the per-thread out-parameters
+	expectedEncode := []string{
+		"def encode(self) -> bytes:",
+		"status, out_len = _scratch()",
+		"data_ptr = lib.igniffi_encode_values(self._handle, out_len, self._arena._ptr, status)",
+		"return bytes(ffi.buffer(data_ptr, out_len[0]))",
+	}
+	for _, expected := range expectedEncode {
+		if !strings.Contains(code, expected) {
+			t.Errorf("Expected encode code to contain:\n%s\n\nGot:\n%s", expected, code)
+		}
+	}
+
+	if strings.Contains(code, "ffi.new('igniffi_Status*')") {
+		t.Error("Expected status to come from _scratch(), not a per-call ffi.new")
+	}
+}
+
+func TestGenerateIgniffiPythonWrapperScratch(t *testing.T) {
+	s := &schema.Schema{
+		Package: "test",
+		Messages: []schema.MessageType{
+			{Name: "Values", TargetType: &schema.ArrayType{
+				ElementType: &schema.PrimitiveType{Name: "int32"},
+			}},
+		},
+	}
+
+	dir := t.TempDir()
+	if err := generatePythonWrapper(&PackageConfig{Schema: s}, dir, "test"); err != nil {
+		t.Fatalf("generatePythonWrapper failed: %v", err)
+	}
+
+	data, err := os.ReadFile(filepath.Join(dir, "__init__.py"))
+	if err != nil {
+		t.Fatalf("failed to read __init__.py: %v", err)
+	}
+	code := string(data)
+
+	expected := []string{
+		"import threading",
+		"_tls = threading.local()",
+		"def _scratch():",
+		"_tls.scratch = (ffi.new('igniffi_Status*'), ffi.new('size_t*'))",
+	}
+	for _, exp := range expected {
+		if !strings.Contains(code, exp) {
+			t.Errorf("Expected __init__.py to contain: %s", exp)
+		}
+	}
+}